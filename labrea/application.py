@@ -6,7 +6,19 @@ else:
     from typing import Concatenate, ParamSpec
 
 import inspect
-from typing import Callable, Dict, Generic, Optional, Set, TypeVar, Union, overload
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    MutableMapping,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from .arguments import Arguments, arguments
 from .types import Evaluatable, MaybeEvaluatable, Options
@@ -15,6 +27,24 @@ P = ParamSpec("P")
 A = TypeVar("A", covariant=True)
 X = TypeVar("X")
 
+_SIGNATURES: MutableMapping[Callable[..., Any], inspect.Signature] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Return :code:`inspect.signature(func)`, memoized per function.
+
+    Callables that cannot be weakly referenced or hashed are not memoized.
+    """
+    try:
+        return _SIGNATURES[func]
+    except KeyError:
+        signature = _SIGNATURES[func] = inspect.signature(func)
+        return signature
+    except TypeError:
+        return inspect.signature(func)
+
 
 class FunctionApplication(Generic[P, A], Evaluatable[A]):
     """A class representing the application of a function to a set of arguments.
@@ -132,7 +162,7 @@ class FunctionApplication(Generic[P, A], Evaluatable[A]):
         if __func is None:
             return lambda f: cls.lift(f, **kwargs)
 
-        signature = inspect.signature(__func)
+        signature = _signature(__func)
         eval_kwargs: Dict[str, Evaluatable["P.kwargs"]] = {}
 
         for param in signature.parameters.values():
@@ -185,6 +215,9 @@ class PartialApplication(Generic[X, P, A], Evaluatable[Callable[[X], A]]):
 
     def evaluate(self, options: Options) -> Callable[[X], A]:
         args = self.arguments.evaluate(options)
+        if not args.args and not args.kwargs:
+            # Nothing to bind, so skip wrapping the function in another call
+            return self.func
         return lambda x: self.func(x, *args.args, **args.kwargs)
 
     def validate(self, options: Options) -> None:
@@ -262,7 +295,7 @@ class PartialApplication(Generic[X, P, A], Evaluatable[Callable[[X], A]]):
         if __func is None:
             return lambda f: cls.lift(f, **kwargs)
 
-        signature = inspect.signature(__func)
+        signature = _signature(__func)
         eval_kwargs: Dict[str, Evaluatable["P.kwargs"]] = {}
 
         for i, param in enumerate(signature.parameters.values()):
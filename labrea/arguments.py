@@ -5,7 +5,7 @@ if sys.version_info < (3, 10):
 else:
     from typing import ParamSpec
 
-from typing import Dict, Generic, Optional, Set, Tuple
+from typing import Any, Dict, Generic, Optional, Set, Tuple
 
 from .types import Evaluatable, MaybeEvaluatable, Options
 
@@ -30,6 +30,16 @@ class Arguments(Generic[P]):
         self.args = args
         self.kwargs = kwargs
 
+    @classmethod
+    def _from_evaluated(
+        cls, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> "Arguments[P]":
+        """Wrap an already built args tuple and kwargs dict without re-packing them."""
+        arguments = cls.__new__(cls)
+        arguments.args = args
+        arguments.kwargs = kwargs
+        return arguments
+
     def __repr__(self) -> str:
         args_repr = ", ".join(map(repr, self.args))
         kwargs_repr = ", ".join(
@@ -58,6 +68,10 @@ class EvaluatableArgs(Generic[P], Evaluatable["P.args"]):
         self.args = args
 
     def evaluate(self, options: Options) -> "P.args":
+        if not self.args:
+            return ()  # type: ignore
+        if len(self.args) == 1:
+            return (self.args[0].evaluate(options),)  # type: ignore
         return tuple(arg.evaluate(options) for arg in self.args)  # type: ignore
 
     def validate(self, options: Options) -> None:
@@ -65,10 +79,16 @@ class EvaluatableArgs(Generic[P], Evaluatable["P.args"]):
             arg.validate(options)
 
     def keys(self, options: Options) -> Set[str]:
-        return set().union(*(arg.keys(options) for arg in self.args))
+        keys: Set[str] = set()
+        for arg in self.args:
+            keys |= arg.keys(options)
+        return keys
 
     def explain(self, options: Optional[Options] = None) -> Set[str]:
-        return set().union(*(arg.explain(options) for arg in self.args))
+        keys: Set[str] = set()
+        for arg in self.args:
+            keys |= arg.explain(options)
+        return keys
 
     def __repr__(self) -> str:
         return f"EvaluatableArgs({', '.join(map(repr, self.args))})"
@@ -89,6 +109,8 @@ class EvaluatableKwargs(Generic[P], Evaluatable["P.kwargs"]):
         self.kwargs = kwargs
 
     def evaluate(self, options: Options) -> "P.kwargs":
+        if not self.kwargs:
+            return {}  # type: ignore
         return {key: value.evaluate(options) for key, value in self.kwargs.items()}  # type: ignore
 
     def validate(self, options: Options) -> None:
@@ -96,10 +118,16 @@ class EvaluatableKwargs(Generic[P], Evaluatable["P.kwargs"]):
             value.validate(options)
 
     def keys(self, options: Options) -> Set[str]:
-        return set().union(*(value.keys(options) for value in self.kwargs.values()))
+        keys: Set[str] = set()
+        for value in self.kwargs.values():
+            keys |= value.keys(options)
+        return keys
 
     def explain(self, options: Optional[Options] = None) -> Set[str]:
-        return set().union(*(value.explain(options) for value in self.kwargs.values()))
+        keys: Set[str] = set()
+        for value in self.kwargs.values():
+            keys |= value.explain(options)
+        return keys
 
     def __repr__(self) -> str:
         return (
@@ -128,7 +156,10 @@ class EvaluatableArguments(Evaluatable[Arguments[P]]):
         self.kwargs = EvaluatableKwargs(**kwargs)
 
     def evaluate(self, options: Options) -> Arguments[P]:
-        return Arguments(*self.args.evaluate(options), **self.kwargs.evaluate(options))
+        # Both evaluations build fresh containers, so hand them over as-is
+        return Arguments._from_evaluated(
+            self.args.evaluate(options), self.kwargs.evaluate(options)
+        )
 
     def validate(self, options: Options) -> None:
         self.args.validate(options)
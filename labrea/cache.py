@@ -1,7 +1,20 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Generic, Optional, Set, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from . import runtime
+from ._missing import MISSING
 from .option import Option
 from .types import Evaluatable, Options
 
@@ -148,6 +161,34 @@ class NoCache(Cache[Any]):
         pass
 
 
+class _KnownFingerprints(threading.local):
+    fingerprints: Dict[Tuple[int, int], Optional[bytes]]
+
+    def __init__(self) -> None:
+        self.fingerprints = {}
+
+
+_KNOWN_FINGERPRINTS = _KnownFingerprints()
+
+
+def _fingerprint(evaluatable: Evaluatable, options: Options) -> bytes:
+    """Return the fingerprint for an evaluation.
+
+    Only MemoryCache needs fingerprints. Within an enclosing
+    :meth:`Cached.evaluate` on this thread, the fingerprint is computed on first
+    use and reused for the rest of that evaluation.
+    """
+    fingerprints = _KNOWN_FINGERPRINTS.fingerprints
+    key = (id(evaluatable), id(options))
+    if key not in fingerprints:
+        return evaluatable.fingerprint(options)
+
+    fingerprint = fingerprints[key]
+    if fingerprint is None:
+        fingerprint = fingerprints[key] = evaluatable.fingerprint(options)
+    return fingerprint
+
+
 class MemoryCache(Cache[A]):
     """A class representing a cache that stores values in memory."""
 
@@ -158,15 +199,15 @@ class MemoryCache(Cache[A]):
 
     def get(self, evaluatable: Evaluatable, options: Options) -> A:
         try:
-            return self._cache[evaluatable.fingerprint(options)]
+            return self._cache[_fingerprint(evaluatable, options)]
         except KeyError as e:
             raise CacheGetFailure(evaluatable, options, self) from e
 
     def set(self, evaluatable: Evaluatable, options: Options, value: A) -> None:
-        self._cache[evaluatable.fingerprint(options)] = value
+        self._cache[_fingerprint(evaluatable, options)] = value
 
     def exists(self, evaluatable: Evaluatable, options: Options) -> bool:
-        return evaluatable.fingerprint(options) in self._cache
+        return _fingerprint(evaluatable, options) in self._cache
 
 
 class CacheSetRequest(runtime.Request[A]):
@@ -244,12 +285,13 @@ class CacheExistsRequest(runtime.Request[bool]):
         self.cache = cache
 
 
+_CACHE_DISABLED = Option("LABREA.CACHE.DISABLED", Option("LABREA.CACHE.DISABLE", False))
+
+
 def _cache_disabled(
     request: Union[CacheSetRequest, CacheGetRequest, CacheExistsRequest]
 ) -> bool:
-    return Option("LABREA.CACHE.DISABLED", Option("LABREA.CACHE.DISABLE", False))(
-        request.options
-    )
+    return _CACHE_DISABLED(request.options)
 
 
 @CacheSetRequest.handle
@@ -292,6 +334,22 @@ def _disabled_exists_cache_handler(request: CacheExistsRequest) -> bool:
     return False
 
 
+def _single_flight(cache: Cache, options: Options) -> bool:
+    """Whether concurrent misses for this cache can wait on one evaluation.
+
+    Only a MemoryCache behind the default, enabled request handlers is known to
+    store one shared result per fingerprint.
+    """
+    handlers = runtime.current_runtime().handlers
+    return (
+        isinstance(cache, MemoryCache)
+        and handlers.get(CacheExistsRequest) is _exists_cache_handler
+        and handlers.get(CacheGetRequest) is _get_cache_handler
+        and handlers.get(CacheSetRequest) is _set_cache_handler
+        and not _CACHE_DISABLED(options)
+    )
+
+
 def disabled() -> runtime.Runtime:
     return runtime.handle(
         {
@@ -302,6 +360,12 @@ def disabled() -> runtime.Runtime:
     )
 
 
+_IN_FLIGHT_LOCK = threading.Lock()
+_IN_FLIGHT: Dict[Tuple[int, int, bytes], Tuple[threading.Event, int]] = {}
+# Seconds to wait for another thread's evaluation before evaluating anyway
+_IN_FLIGHT_TIMEOUT = 60.0
+
+
 class Cached(Evaluatable[A]):
     """A class representing an Evaluatable that may be cached.
 
@@ -326,13 +390,75 @@ class Cached(Evaluatable[A]):
         self.cache = cache
 
     def evaluate(self, options: Options) -> A:
-        """Return the (possibly cached) result of evaluating the evaluatable."""
-        if CacheExistsRequest(self.evaluatable, options, self.cache).run():
+        """Return the (possibly cached) result of evaluating the evaluatable.
+
+        If another thread is already evaluating the same value for the same
+        MemoryCache, wait for it to finish and use its cached result instead of
+        evaluating again.
+        """
+        if not _single_flight(self.cache, options):
+            return self._evaluate(options)
+
+        # The fingerprint is computed on first use, and then reused by
+        # MemoryCache for every cache request made during this evaluation.
+        known = _KNOWN_FINGERPRINTS.fingerprints
+        key = (id(self.evaluatable), id(options))
+        previous = known.get(key, MISSING)
+        known[key] = None
+        try:
+            return self._evaluate_once(options)
+        finally:
+            if previous is MISSING:
+                del known[key]
+            else:
+                known[key] = previous
+
+    def _get(self, options: Options) -> A:
+        if not CacheExistsRequest(self.evaluatable, options, self.cache).run():
+            raise CacheGetFailure(self.evaluatable, options, self.cache)
+
+        return CacheGetRequest(self.evaluatable, options, self.cache).run()
+
+    def _evaluate(self, options: Options) -> A:
+        try:
+            return self._get(options)
+        except CacheGetFailure:
+            return self._evaluate_and_set(options)
+
+    def _evaluate_once(self, options: Options) -> A:
+        try:
+            return self._get(options)
+        except CacheGetFailure:
+            pass
+
+        try:
+            fingerprint = _fingerprint(self.evaluatable, options)
+        except TypeError:
+            # Options that can't be fingerprinted can't be shared between threads
+            return self._evaluate_and_set(options)
+
+        key = (id(self.cache), id(self.evaluatable), fingerprint)
+        thread = threading.get_ident()
+        with _IN_FLIGHT_LOCK:
+            event, owner = _IN_FLIGHT.get(key, (None, thread))
+            if event is None:
+                _IN_FLIGHT[key] = (threading.Event(), thread)
+
+        if event is not None and owner != thread:
+            event.wait(_IN_FLIGHT_TIMEOUT)
             try:
                 return CacheGetRequest(self.evaluatable, options, self.cache).run()
             except CacheGetFailure:
-                pass
+                return self._evaluate_and_set(options)
+
+        try:
+            return self._evaluate_and_set(options)
+        finally:
+            if event is None:
+                with _IN_FLIGHT_LOCK:
+                    _IN_FLIGHT.pop(key)[0].set()
 
+    def _evaluate_and_set(self, options: Options) -> A:
         value = self.evaluatable.evaluate(options)
 
         return CacheSetRequest(self.evaluatable, options, value, self.cache).run()
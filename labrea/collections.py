@@ -1,6 +1,6 @@
 from typing import Dict, Hashable, List, Set, Tuple, TypeVar, Union, overload
 
-from .iterable import Iter
+from .iterable import _EagerIter
 from .types import Evaluatable, Value
 
 A = TypeVar("A")
@@ -28,7 +28,7 @@ def evaluatable_list(*evaluatables: Evaluatable[A]) -> Evaluatable[List[A]]:
     *evaluatables : Evaluatable[A]
         The objects to evaluate.
     """
-    return Iter(*evaluatables).apply(list)
+    return _EagerIter(*evaluatables).apply(list)
 
 
 @overload
@@ -127,7 +127,7 @@ def evaluatable_tuple(*evaluatables: Evaluatable[A]) -> Evaluatable[Tuple[A, ...
     *evaluatables : Evaluatable[A]
         The objects to evaluate.
     """
-    return Iter(*evaluatables).apply(tuple)
+    return _EagerIter(*evaluatables).apply(tuple)
 
 
 def evaluatable_set(*evaluatables: Evaluatable[K]) -> Evaluatable[Set[K]]:
@@ -142,7 +142,7 @@ def evaluatable_set(*evaluatables: Evaluatable[K]) -> Evaluatable[Set[K]]:
     *evaluatables : Evaluatable[K]
         The objects to evaluate.
     """
-    return Iter(*evaluatables).apply(set)
+    return _EagerIter(*evaluatables).apply(set)
 
 
 def evaluatable_dict(contents: Dict[K, Evaluatable[V]]) -> Evaluatable[Dict[K, V]]:
@@ -157,8 +157,8 @@ def evaluatable_dict(contents: Dict[K, Evaluatable[V]]) -> Evaluatable[Dict[K, V
     contents : Dict[K, Evaluatable[V]]
         The objects to evaluate.
     """
-    pairs = (Iter[Union[K, V]](Value(key), val) for key, val in contents.items())
-    return Iter(*pairs).apply(dict)  # type: ignore
+    pairs = (_EagerIter[Union[K, V]](Value(key), val) for key, val in contents.items())
+    return _EagerIter(*pairs).apply(dict)  # type: ignore
 
 
 DatasetList = evaluatable_list
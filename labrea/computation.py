@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional, Set, TypeVar
+from typing import Callable, Optional, Set, Tuple, TypeVar
 
 from .option import Option
 from .types import (
@@ -59,10 +59,10 @@ class ChainedEffect(Effect[A]):
         The effects to chain together.
     """
 
-    effects: List[Effect[A]]
+    effects: Tuple[Effect[A], ...]
 
     def __init__(self, *effects: Effect[A]):
-        self.effects = list(effects)
+        self.effects = effects
 
     def transform(self, value: A, options: Optional[Options] = None) -> None:
         """Perform each effect in sequence."""
@@ -76,7 +76,10 @@ class ChainedEffect(Effect[A]):
 
     def explain(self, options: Optional[Options] = None) -> Set[str]:
         """Return the option keys required to perform each effect."""
-        return set().union(*(effect.explain(options) for effect in self.effects))
+        keys: Set[str] = set()
+        for effect in self.effects:
+            keys |= effect.explain(options)
+        return keys
 
     def __repr__(self) -> str:
         return f"ChainedEffect({', '.join(map(repr, self.effects))})"
@@ -24,7 +24,7 @@ from typing import (
 from ._missing import MISSING, MaybeMissing
 from .exceptions import EvaluationError, InsufficientInformationError
 from .option import Option
-from .types import Evaluatable, MaybeEvaluatable, Options
+from .types import Evaluatable, MaybeEvaluatable, Options, Value
 
 A = TypeVar("A")
 B = TypeVar("B")
@@ -83,6 +83,10 @@ class Switch(Evaluatable[V]):
     cannot be evaluated, a default value can be provided. If no default is provided,
     and the switch cannot choose a branch, an error is raised.
 
+    The lookup is copied when the switch is created. If the dispatch is a
+    constant, its branch is selected once and reused, so change the lookup by
+    reassigning it rather than by mutating it in place.
+
     Aliases: :func:`labrea.switch`, :class:`labrea.Switch`
 
 
@@ -130,10 +134,32 @@ class Switch(Evaluatable[V]):
             Evaluatable.ensure(default) if default is not MISSING else default
         )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Reassigning the dispatch, lookup or default can change the branch
+        self.__dict__.pop("_branch", None)
+
+    @functools.cached_property
+    def _branch(self) -> MaybeMissing[Evaluatable[V]]:
+        # A constant dispatch always selects the same branch, so select it once
+        if isinstance(self.dispatch, Value):
+            try:
+                return self._select({})
+            except SwitchError:
+                pass
+        return MISSING
+
     def _dispatch(self, options: Options) -> Hashable:
         return self.dispatch.evaluate(options)
 
     def _lookup(self, options: Options) -> Evaluatable[V]:
+        branch = self._branch
+        if branch is not MISSING:
+            return branch
+
+        return self._select(options)
+
+    def _select(self, options: Options) -> Evaluatable[V]:
         try:
             key = self._dispatch(options)
         except EvaluationError as e:
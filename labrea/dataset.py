@@ -21,14 +21,12 @@ from typing import (
     overload,
 )
 
-from confectioner import mix
-
 from ._missing import MISSING, MaybeMissing
 from .application import FunctionApplication
 from .cache import Cache, MemoryCache, NoCache, cached
 from .computation import CallbackEffect, ChainedEffect, Computation, Effect
 from .logging import Logged
-from .option import Option, WithDefaultOptions, WithOptions
+from .option import Option, WithDefaultOptions, WithOptions, _mix
 from .overload import Overloaded
 from .types import Evaluatable, MaybeEvaluatable, Options, Value
 
@@ -92,28 +90,37 @@ class Dataset(Evaluatable[A]):
         self.default_options = default_options
         self._effects_disabled = False
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Any reassignment (set_cache, set_dispatch, disable_effects, ...) can
+        # change the composed evaluatable, so drop the cached one.
+        self.__dict__.pop("_composed", None)
+
+    @functools.cached_property
     def _composed(self) -> Evaluatable[A]:
-        computation = Computation(
-            self.overloads,
-            ChainedEffect(*self.effects),
-        )
-        return WithDefaultOptions(
-            WithOptions(
-                cached(
-                    Logged(
-                        self.overloads if self._effects_disabled else computation,
-                        level=logging.INFO,
-                        name=self.__module__,
-                        msg=f"Labrea: Evaluating {self!r}",
-                    ),
-                    self.cache,
-                ),
-                self.options,
+        # Layers that would be no-ops (no effects, no options) are left out so
+        # that evaluation doesn't pass through them on every call.
+        composed: Evaluatable[A] = self.overloads
+        if self.effects and not self._effects_disabled:
+            composed = Computation(composed, ChainedEffect(*self.effects))
+
+        composed = cached(
+            Logged(
+                composed,
+                level=logging.INFO,
+                name=self.__module__,
+                msg=f"Labrea: Evaluating {self!r}",
             ),
-            self.default_options,
+            self.cache,
         )
 
+        if self.options:
+            composed = WithOptions(composed, self.options)
+        if self.default_options:
+            composed = WithDefaultOptions(composed, self.default_options)
+
+        return composed
+
     def evaluate(self, options: Options) -> A:
         """Evaluates the dataset using the provided options."""
         return self._composed.evaluate(options)
@@ -289,6 +296,8 @@ class Dataset(Evaluatable[A]):
             else:
                 self.effects.append(CallbackEffect(effect))
 
+        self.__dict__.pop("_composed", None)
+
     add_effect = add_effects
 
     def disable_effects(self) -> None:
@@ -339,7 +348,7 @@ class Dataset(Evaluatable[A]):
             self.overloads,
             self.effects,
             self.cache,
-            mix(self.options, options),  # type: ignore
+            _mix(self.options, options),
             self.default_options,
         )
 
@@ -365,7 +374,7 @@ class Dataset(Evaluatable[A]):
             self.effects,
             self.cache,
             self.options,
-            mix(self.default_options, options),  # type: ignore
+            _mix(self.default_options, options),
         )
 
     @property
@@ -537,15 +546,33 @@ class DatasetFactory(Generic[A]):
         options: Optional[Options] = None,
         default_options: Optional[Options] = None,
     ) -> "DatasetFactory":
-        return DatasetFactory(
-            effects=[*self.effects, *(effects or [])],
-            cache=cache or self.cache,
-            dispatch=dispatch or self.dispatch,
-            defaults={**self.defaults, **(defaults or {})},
-            abstract=abstract if abstract is not None else self.abstract,
-            options=options or self.options,
-            default_options=default_options or self.default_options,
-        )
+        # Start from a copy of this factory's fields and only rebuild the ones
+        # being changed, rather than re-running __init__ (which re-wraps every
+        # default and copies every collection) on each builder call.
+        factory: DatasetFactory = object.__new__(DatasetFactory)
+        factory.__dict__.update(self.__dict__)
+
+        if effects:
+            factory.effects = [*self.effects, *effects]
+        if cache:
+            factory.cache = cache
+        if dispatch:
+            factory.dispatch = (
+                Option(dispatch) if isinstance(dispatch, str) else dispatch
+            )
+        if defaults:
+            factory.defaults = {
+                **self.defaults,
+                **{key: Evaluatable.ensure(val) for key, val in defaults.items()},
+            }
+        if abstract is not None:
+            factory.abstract = abstract
+        if options:
+            factory.options = options
+        if default_options:
+            factory.default_options = default_options
+
+        return factory
 
     @property
     def nocache(self) -> "DatasetFactory":
@@ -1,19 +1,96 @@
 import functools
 import operator
-from types import new_class
-from typing import Any, Dict, Optional, Set, Type, TypeVar
-
-from confectioner.templating import set_dotted_key
-
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .option import _split_dotted_key
 from .types import Evaluatable, Options, Value
 
 A = TypeVar("A")
 
 
+def _repr_options(values: Mapping[str, Any]) -> Dict[str, Any]:
+    """Build the nested options dictionary shown in a DatasetClass repr.
+
+    Equivalent to :code:`set_dotted_key(key, values[key], ...)` for each
+    sorted key, without writing into the caller's nested options.
+    """
+    repr_options: Dict[str, Any] = {}
+    for key in sorted(values):
+        *parents, leaf = _split_dotted_key(key)
+        target = repr_options
+        for part in parents:
+            child = target.get(part)
+            child = dict(child) if isinstance(child, Mapping) else {}
+            target[part] = child
+            target = child
+        target[leaf] = values[key]
+
+    return repr_options
+
+
+def _collect_fields(cls: type) -> Tuple[Tuple[str, Evaluatable], ...]:
+    """Return the Evaluatable members of a class, sorted by name.
+
+    The first definition found along the MRO shadows any later ones, the same
+    as for normal attribute lookup.
+    """
+    # Bound locally so the loops below use fast local lookups
+    _isinstance, _Evaluatable, _intern = isinstance, Evaluatable, sys.intern
+
+    members: Dict[str, Any] = {}
+    for base in cls.__mro__:
+        for name, member in vars(base).items():
+            if not name.startswith("__"):
+                members.setdefault(name, member)
+
+    return tuple(
+        (_intern(name), member)
+        for name, member in sorted(members.items())
+        if _isinstance(member, _Evaluatable)
+    )
+
+
 class _DatasetClassMeta(type, Evaluatable[A]):
-    """Metaclass for DatasetClass objects."""
+    """Metaclass for DatasetClass objects.
+
+    This only exists so that DatasetClasses are themselves Evaluatables. The
+    Evaluatable methods are implemented as classmethods on
+    :class:`_DatasetClassMixin`, and members are collected in its
+    :code:`__init_subclass__`.
+    """
+
+    def __subclasses__(cls=None):
+        return []
+
+    @property
+    def result(cls) -> A:
+        return cls  # type: ignore
+
+    def __repr__(self):
+        return f"<DatasetClass {self.__name__}>"
+
+
+class _DatasetClassMixin:
+    """Mixin for DatasetClass objects."""
+
+    _labrea_fields: Tuple[Tuple[str, Evaluatable], ...]
+    _labrea_evaluators: Tuple[Tuple[str, Callable[[Options], Any]], ...]
+    _labrea_option_values: Dict[str, Any]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-    def __init__(cls, *args, **kwargs):
         annotations = functools.reduce(
             operator.or_,
             (
@@ -23,6 +100,8 @@ class _DatasetClassMeta(type, Evaluatable[A]):
             ),
         )
 
+        # Bound locally so the loop below uses fast local lookups
+        _isinstance, _Evaluatable, _Value = isinstance, Evaluatable, Value
         for key in annotations.keys():
             try:
                 val = getattr(cls, key)
@@ -32,72 +111,53 @@ class _DatasetClassMeta(type, Evaluatable[A]):
                     f"no default value."
                 )
 
-            if not isinstance(val, Evaluatable):
-                setattr(cls, key, Value(val))
+            if not _isinstance(val, _Evaluatable):
+                setattr(cls, key, _Value(val))
 
-        super().__init__(*args, **kwargs)
+        # The set of evaluatable members is fixed once the class is created, so
+        # the scan is done here once rather than on every evaluate/keys/explain.
+        cls._labrea_fields = _collect_fields(cls)
+        cls._labrea_evaluators = tuple(
+            (name, member.evaluate) for name, member in cls._labrea_fields
+        )
 
-    def evaluate(cls, options: Options) -> A:
+    @classmethod
+    def evaluate(cls, options: Options) -> "_DatasetClassMixin":
         return cls(options)
 
+    @classmethod
     def validate(cls, options: Options) -> None:
-        for key in dir(cls):
-            dependency = getattr(cls, key, None)
-            if isinstance(dependency, Evaluatable) and not key.startswith("__"):
-                dependency.validate(options)
+        for _, dependency in cls._labrea_fields:
+            dependency.validate(options)
 
+    @classmethod
     def keys(cls, options: Options) -> Set[str]:
-        return {
-            key
-            for name in dir(cls)
-            if (
-                isinstance(getattr(cls, name), Evaluatable)
-                and not name.startswith("__")
-            )
-            for key in getattr(cls, name).keys(options)
-        }
+        keys: Set[str] = set()
+        for _, dependency in cls._labrea_fields:
+            keys |= dependency.keys(options)
+        return keys
 
+    @classmethod
     def explain(cls, options: Optional[Options] = None) -> Set[str]:
-        return {
-            key
-            for name in dir(cls)
-            if (
-                isinstance(getattr(cls, name), Evaluatable)
-                and not name.startswith("__")
-            )
-            for key in getattr(cls, name).explain(options)
-        }
-
-    def __subclasses__(cls=None):
-        return []
-
-    @property
-    def result(cls) -> A:
-        return cls  # type: ignore
-
-    def __repr__(self):
-        return f"<DatasetClass {self.__name__}>"
-
-
-class _DatasetClassMixin:
-    """Mixin for DatasetClass objects."""
-
-    _repr_options: Dict[str, Any]
+        keys: Set[str] = set()
+        for _, dependency in cls._labrea_fields:
+            keys |= dependency.explain(options)
+        return keys
 
     def __init__(self, options: Optional[Options] = None):
         options = options or {}
 
-        key: str
-        val: Any
-        for key in dir(self.__class__):
-            val = getattr(self, key)
-            if isinstance(val, Evaluatable) and not key.startswith("__"):
-                setattr(self, key, val.evaluate(options))
+        for key, evaluate in self._labrea_evaluators:
+            setattr(self, key, evaluate(options))
 
-        self._repr_options = {}
-        for key in sorted(self.__class__.keys(options)):  # type: ignore [attr-defined]
-            value = options.get(key)
-            set_dotted_key(key, value, self._repr_options)
+        # Only the values are captured here; they are formatted on first use
+        self._labrea_option_values = {
+            key: options.get(key) for key in self.keys(options)
+        }
+
+    @functools.cached_property
+    def _repr_options(self) -> Dict[str, Any]:
+        return _repr_options(self._labrea_option_values)
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self._repr_options!r})"
@@ -137,10 +197,16 @@ def datasetclass(c: Type[A]) -> _DatasetClassMeta[A]:
     >>> print(inst.a, inst.b, inst.c)
     Hello World! 1 True
     """
-    dataset_class = new_class(
-        c.__name__, (c, _DatasetClassMixin), kwds={"metaclass": _DatasetClassMeta}
+    namespace = {
+        "__module__": c.__module__,
+        "__qualname__": c.__qualname__,
+        "__doc__": c.__doc__,
+        "__annotations__": getattr(c, "__annotations__", {}),
+        "__wrapped__": c,
+    }
+    # The Evaluatable methods are classmethods on _DatasetClassMixin
+    dataset_class: _DatasetClassMeta[A] = _DatasetClassMeta(  # type: ignore [abstract]
+        c.__name__, (c, _DatasetClassMixin), namespace
     )
 
-    functools.update_wrapper(dataset_class, c, updated=())
-
-    return dataset_class  # type: ignore
+    return dataset_class
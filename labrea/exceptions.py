@@ -31,6 +31,10 @@ class KeyNotFoundError(EvaluationError):
 
         super().__init__(f"Key '{self.key}' not found", source)
 
+    def __reduce__(self):
+        # args holds the formatted message, not the key
+        return type(self), (self.key, self.source)
+
 
 class InsufficientInformationError(EvaluationError):
     """Error raised when not enough information is provided to explain an object."""
@@ -1,16 +1,35 @@
 import builtins
 import functools
-from typing import Callable, Iterable, TypeVar
+import types
+from typing import Any, Callable, Iterable, TypeVar
 
 from ._missing import MISSING, MaybeMissing
 from .application import FunctionApplication
 from .pipeline import PipelineStep
-from .types import MaybeEvaluatable
+from .types import Evaluatable, MaybeEvaluatable, Value
 
 A = TypeVar("A")
 B = TypeVar("B")
 
 
+def _partial(func: Callable, *args: Any, **kwargs: Any) -> Evaluatable[Callable]:
+    """Lazily partially apply a function to possibly-evaluatable arguments.
+
+    If none of the arguments are Evaluatables the partial can be built once
+    up front, rather than on every evaluation.
+    """
+    if any(isinstance(arg, Evaluatable) for arg in (*args, *kwargs.values())):
+        return FunctionApplication(functools.partial, func, *args, **kwargs)
+
+    return Value(functools.partial(func, *args, **kwargs))
+
+
+def _label(name: str, *args: Any, **kwargs: Any) -> str:
+    """Format a step's label, deferred until the step is actually printed."""
+    params = [*(repr(arg) for arg in args), *(f"{k}={v!r}" for k, v in kwargs.items())]
+    return f"{name}({', '.join(params)})"
+
+
 def map(
     func: MaybeEvaluatable[Callable[[A], B]]
 ) -> PipelineStep[Iterable[A], Iterable[B]]:
@@ -36,10 +55,8 @@ def map(
     [2, 3, 4, 5]
     """
     return PipelineStep(
-        FunctionApplication(
-            functools.partial, builtins.map, func  # type: ignore [arg-type]
-        ),
-        f"map({func!r})",
+        _partial(builtins.map, func),
+        functools.partial(_label, "map", func),
     )
 
 
@@ -68,20 +85,37 @@ def filter(
     [2, 4]
     """
     return PipelineStep(
-        FunctionApplication(
-            functools.partial, builtins.filter, func  # type: ignore [arg-type]
-        ),
-        f"filter({func!r})",
+        _partial(builtins.filter, func),
+        functools.partial(_label, "filter", func),
     )
 
 
-def _reduce(
-    func: Callable[[A, A], A], iterable: Iterable[A], initial: MaybeMissing[A]
+def _reduce(func: Callable[[A, A], A], iterable: Iterable[A], initial: A) -> A:
+    return functools.reduce(func, iterable, initial)
+
+
+def _fold(
+    func: Callable[[A, A], A], iterable: Iterable[A], initial: MaybeMissing[A] = MISSING
 ) -> A:
+    """Reduce an iterable with a plain Python loop.
+
+    For Python-level functions this is faster than :code:`functools.reduce`,
+    as the interpreter can specialize the call in the loop. C functions are
+    still faster with :code:`functools.reduce`.
+    """
+    iterator = iter(iterable)
     if initial is MISSING:
-        return functools.reduce(func, iterable)
+        try:
+            initial = next(iterator)
+        except StopIteration:
+            raise TypeError(
+                "reduce() of empty iterable with no initial value"
+            ) from None
 
-    return functools.reduce(func, iterable, initial)
+    accumulated = initial
+    for item in iterator:
+        accumulated = func(accumulated, item)
+    return accumulated
 
 
 def reduce(
@@ -113,11 +147,14 @@ def reduce(
     >>> (Option('A') >> F.reduce(lambda x, y: x + y))({'A': [1, 2, 3, 4]})
     10
     """
-    return PipelineStep(
-        FunctionApplication(
-            functools.partial, _reduce, func, initial=initial  # type: ignore [arg-type]
-        ),
-        f"reduce({func!r})"
+    label = (
+        functools.partial(_label, "reduce", func)
         if initial is MISSING
-        else f"reduce({func!r}, initial={initial!r})",
+        else functools.partial(_label, "reduce", func, initial=initial)
     )
+
+    if isinstance(func, types.FunctionType):
+        return PipelineStep(_partial(_fold, func, initial=initial), label)
+    if initial is MISSING:
+        return PipelineStep(_partial(functools.reduce, func), label)
+    return PipelineStep(_partial(_reduce, func, initial=initial), label)
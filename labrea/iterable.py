@@ -66,6 +66,18 @@ class Iter(Evaluatable[Iterable[A]]):
         return f"Iter({', '.join(map(repr, self.evaluatables))})"
 
 
+class _EagerIter(Iter[A]):
+    """An Iter that evaluates all of its members up front.
+
+    Used where the result is immediately collected into a container, so the
+    laziness of a generator only adds overhead.
+    """
+
+    def evaluate(self, options: Options) -> Iterable[A]:
+        """Evaluate the evaluatables and return a list of the results."""
+        return [evaluatable.evaluate(options) for evaluatable in self.evaluatables]
+
+
 class Map(Evaluatable[Iterable[Tuple[Dict[str, JSON], A]]]):
     """A class that represents the same evaluatable repeated over multiple options.
 
@@ -146,12 +158,12 @@ class Map(Evaluatable[Iterable[Tuple[Dict[str, JSON], A]]]):
     ) -> Evaluatable[Iterable[Tuple[Dict[str, JSON], A]]]:
         return Iter(
             *(
-                Iter(
-                    Iter(*option_tuples).apply(dict),  # type: ignore
+                _EagerIter(
+                    _EagerIter(*option_tuples).apply(dict),  # type: ignore
                     WithOptions(  # type: ignore
                         self.evaluatable, self._create_option_set(*option_tuples)
                     ),
-                ).apply(lambda x: tuple(x))
+                ).apply(tuple)
                 for option_tuples in self._iterate_over_options(options)
             )
         )
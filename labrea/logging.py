@@ -9,6 +9,8 @@ from .types import Evaluatable, Options
 
 A = TypeVar("A")
 
+_LOGGING_DISABLED = Option("LABREA.LOGGING.DISABLED", False)
+
 
 class LogRequest(Request[None]):
     """A request to log a message.
@@ -68,7 +70,7 @@ def _disabled_logging_handler(request: LogRequest) -> None:
 
 @LogRequest.handle
 def _builtin_logging_handler(request: LogRequest) -> None:
-    if Option("LABREA.LOGGING.DISABLED", False)(request.options):
+    if _LOGGING_DISABLED(request.options):
         return _disabled_logging_handler(request)
 
     logging.getLogger(request.name).log(request.level, request.msg)
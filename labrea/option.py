@@ -1,18 +1,93 @@
-from typing import Callable, Optional, Set, TypeVar
+import functools
+from typing import Any, Callable, Mapping, Optional, Set, Tuple, TypeVar, Union
 
 from confectioner import mix
-from confectioner.templating import dotted_key_exists, get_dotted_key, resolve
+from confectioner.templating import resolve
 
 from ._missing import MISSING, MaybeMissing
 from .application import FunctionApplication
 from .exceptions import KeyNotFoundError
 from .template import Template
-from .types import JSON, Evaluatable, MaybeEvaluatable, Options
+from .types import JSON, Evaluatable, MaybeEvaluatable, Options, _is_immutable
 
 A = TypeVar("A", covariant=True, bound=JSON)
 B = TypeVar("B", covariant=True)
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_dotted_key(key: str) -> Tuple[str, ...]:
+    return tuple(key.split("."))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_dotted_key(key: str) -> Tuple[Union[str, int], ...]:
+    """Split a dotted key, parsing integer parts as list indices."""
+    parts: Tuple[Union[str, int], ...] = ()
+    for part in _split_dotted_key(key):
+        try:
+            parts += (int(part),)
+        except ValueError:
+            parts += (part,)
+    return parts
+
+
+def _get_dotted_key(key: str, options: Any) -> Any:
+    """Get a nested value using a dotted key.
+
+    Equivalent to :code:`confectioner.templating.get_dotted_key`, but the key is
+    only split and parsed once, rather than on every lookup.
+    """
+    value = options
+    for part in _parse_dotted_key(key):
+        # Integer parts only index lists, and string parts only index mappings
+        if (isinstance(part, int) and isinstance(value, Mapping)) or (
+            isinstance(part, str) and isinstance(value, list)
+        ):
+            raise KeyError(key)
+        try:
+            value = value[part]
+        except (KeyError, IndexError):
+            raise KeyError(key)
+    return value
+
+
+def _dotted_key_exists(key: str, options: Any) -> bool:
+    try:
+        _get_dotted_key(key, options)
+    except KeyError:
+        return False
+    return True
+
+
+def _needs_resolve(value: Any) -> bool:
+    """Whether :code:`resolve` could change a value.
+
+    Only strings containing braces, and containers that may hold such strings,
+    can be templates. Everything else is returned by :code:`resolve` as-is,
+    after it has copied the options and the environment.
+    """
+    if isinstance(value, str):
+        return "{" in value or "}" in value
+    return isinstance(value, (Mapping, list))
+
+
+def _mix(dish: Options, ingredient: Options) -> Options:
+    """Mix two options dictionaries, skipping the recursive merge when possible.
+
+    If the dictionaries share no top-level keys and the ingredient only holds
+    immutable values, there is nothing to merge or copy, so a shallow copy
+    gives the same result as :code:`mix`.
+    """
+    if (
+        type(dish) is dict
+        and type(ingredient) is dict
+        and dish.keys().isdisjoint(ingredient)
+        and all(_is_immutable(value) for value in ingredient.values())
+    ):
+        return {**dish, **ingredient}
+    return mix(dish, ingredient)  # type: ignore
+
+
 class Option(Evaluatable[A]):
     """A class representing a single user-provided option.
 
@@ -83,8 +158,10 @@ class Option(Evaluatable[A]):
         default key is not an Evaluatable, it is returned as-is.
         """
         try:
-            value = get_dotted_key(self.key, options)
-            return resolve(value, options)
+            value = _get_dotted_key(self.key, options)
+            if _needs_resolve(value):
+                return resolve(value, options)
+            return value
         except KeyError:
             if self.default is MISSING:
                 raise KeyNotFoundError(self.key, self)
@@ -97,7 +174,7 @@ class Option(Evaluatable[A]):
         default key is an Evaluatable, it is validated using the options
         dictionary. If the default key is not an Evaluatable, it is ignored.
         """
-        if dotted_key_exists(self.key, options):
+        if _dotted_key_exists(self.key, options):
             _ = self.keys(options)
         elif self.default is not MISSING:
             self.default.validate(options)
@@ -112,13 +189,17 @@ class Option(Evaluatable[A]):
         if the default value is an Evaluatable, the keys required by the
         Evaluatable are also returned.
         """
-        if dotted_key_exists(self.key, options):
-            value = get_dotted_key(self.key, options)
+        try:
+            value = _get_dotted_key(self.key, options)
+        except KeyError:
+            pass
+        else:
             if isinstance(value, str):
                 return {self.key} | Template(value).keys(options)
             else:
                 return {self.key}
-        elif self.default is not MISSING:
+
+        if self.default is not MISSING:
             return self.default.keys(options)
         else:
             raise KeyNotFoundError(self.key, self)
@@ -126,13 +207,17 @@ class Option(Evaluatable[A]):
     def explain(self, options: Optional[Options] = None) -> Set[str]:
         """Returns the keys required by the option."""
         options = options or {}
-        if dotted_key_exists(self.key, options):
-            value = get_dotted_key(self.key, options)
+        try:
+            value = _get_dotted_key(self.key, options)
+        except KeyError:
+            pass
+        else:
             if isinstance(value, str):
                 return {self.key} | Template(value).explain(options)
             else:
                 return {self.key}
-        elif self.default is not MISSING:
+
+        if self.default is not MISSING:
             return self.default.explain(options)
         else:
             return {self.key}
@@ -177,10 +262,10 @@ class WithOptions(Evaluatable[B]):
         self.force = force
 
     def _options(self, options: Options) -> Options:
+        if not self.options:
+            return options
         return (
-            mix(options, self.options)  # type: ignore
-            if self.force
-            else mix(self.options, options)  # type: ignore
+            _mix(options, self.options) if self.force else _mix(self.options, options)
         )
 
     def evaluate(self, options: Options) -> B:
@@ -193,24 +278,28 @@ class WithOptions(Evaluatable[B]):
 
     def keys(self, options: Options) -> Set[str]:
         """Return the keys required by the wrapped Evaluatable object."""
+        if not self.options:
+            return self.evaluatable.keys(options)
         return {
             key
             for key in self.evaluatable.keys(self._options(options))
             if not (
-                dotted_key_exists(key, self.options)
-                and (self.force or not dotted_key_exists(key, options))
+                _dotted_key_exists(key, self.options)
+                and (self.force or not _dotted_key_exists(key, options))
             )
         }
 
     def explain(self, options: Optional[Options] = None) -> Set[str]:
         """Return the explanation for the wrapped Evaluatable object."""
         options = options or {}
+        if not self.options:
+            return self.evaluatable.explain(options)
         return {
             key
             for key in self.evaluatable.explain(self._options(options))
             if not (
-                dotted_key_exists(key, self.options)
-                and (self.force or not dotted_key_exists(key, options))
+                _dotted_key_exists(key, self.options)
+                and (self.force or not _dotted_key_exists(key, options))
             )
         }
 
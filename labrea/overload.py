@@ -5,8 +5,9 @@ if sys.version_info < (3, 10):
 else:
     from typing import ParamSpec
 
+import functools
 import threading
-from typing import Dict, Hashable, Optional, Set, TypeVar
+from typing import Any, Dict, Hashable, Optional, Set, TypeVar
 
 from ._missing import MISSING, MaybeMissing
 from .conditional import switch
@@ -15,13 +16,12 @@ from .types import Evaluatable, MaybeEvaluatable, Options
 A = TypeVar("A", covariant=True)
 P = ParamSpec("P")
 
-_MODULE_LOCK = threading.Lock()
 _LOCKS: Dict[int, threading.Lock] = {}
 
 
 def _get_lock(__x: int) -> threading.Lock:
-    with _MODULE_LOCK:
-        return _LOCKS.setdefault(__x, threading.Lock())
+    # dict.setdefault is atomic, so concurrent callers always get the same lock
+    return _LOCKS.setdefault(__x, threading.Lock())
 
 
 class Overloaded(Evaluatable[A]):
@@ -45,12 +45,14 @@ class Overloaded(Evaluatable[A]):
         The default evaluatable to use if the dispatch key is not found in the
         lookup dictionary. If this is not provided, an exception will be raised
         if the dispatch key is not found.
+
+    The switch is built once and reused. Change the lookup with
+    :meth:`register` or by reassigning it, not by mutating it in place.
     """
 
     dispatch: Evaluatable[Hashable]
     lookup: Dict[Hashable, Evaluatable[A]]
     default: MaybeMissing[Evaluatable[A]]
-    _lock: threading.Lock
 
     def __init__(
         self,
@@ -63,7 +65,21 @@ class Overloaded(Evaluatable[A]):
         self.default = (
             Evaluatable.ensure(default) if default is not MISSING else default
         )
-        self._lock = _get_lock(id(self))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self.__dict__:
+            # First assignment, from __init__, before a switch can be built
+            super().__setattr__(name, value)
+            return
+
+        with self._lock:
+            self._replace(name, value)
+
+    def _replace(self, name: str, value: Any) -> None:
+        # Must be called holding _lock, so that a switch built from the old
+        # attributes can't be cached after they change
+        super().__setattr__(name, value)
+        self.__dict__.pop("_switch", None)
 
     def evaluate(self, options: Options) -> A:
         """Evaluate the dispatch, and then evaluate the selected implementation."""
@@ -87,6 +103,11 @@ class Overloaded(Evaluatable[A]):
 
         return f"Overloaded({self.dispatch!r}, {self.lookup!r}, {self.default!r})"
 
+    @functools.cached_property
+    def _lock(self) -> threading.Lock:
+        # Created on first use, as most overloaded objects are never registered to
+        return _get_lock(id(self))
+
     def register(self, key: Hashable, value: Evaluatable[A]) -> None:
         """Register a new implementation with the overloaded object.
 
@@ -98,16 +119,26 @@ class Overloaded(Evaluatable[A]):
             The implementation to register.
         """
         with self._lock:
-            self.lookup = {**self.lookup, key: value}
+            self._replace("lookup", {**self.lookup, key: value})
 
     @property
     def switch(self) -> Evaluatable[A]:
         """Return the switch evaluatable that determines which implementation to use."""
-        return switch(self.dispatch, self.lookup, default=self.default)
+        try:
+            return self.__dict__["_switch"]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if "_switch" not in self.__dict__:
+                self.__dict__["_switch"] = switch(
+                    self.dispatch, self.lookup, default=self.default
+                )
+            return self.__dict__["_switch"]
 
     def __getstate__(self) -> dict:
         return {**self.__dict__, "_lock": id(self)}
 
     def __setstate__(self, state: dict) -> None:
         self.__dict__.update(state)
-        self._lock = _get_lock(state["_lock"])
+        self.__dict__["_lock"] = _get_lock(state["_lock"])
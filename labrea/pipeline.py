@@ -14,6 +14,7 @@ from typing import (
     Optional,
     Set,
     TypeVar,
+    Union,
     cast,
     overload,
 )
@@ -37,12 +38,15 @@ class PipelineStep(Evaluatable[Callable[[A], B]], Transformation[A, B]):
     """
 
     step: Evaluatable[Callable[[A], B]]
-    _name: Optional[str]
+    _name: Union[str, Callable[[], str], None]
 
     def __init__(
-        self, step: Evaluatable[Callable[[A], B]], _name: Optional[str] = None
+        self,
+        step: Evaluatable[Callable[[A], B]],
+        _name: Union[str, Callable[[], str], None] = None,
     ) -> None:
         self.step = step
+        # The name may be a callable so that it is only formatted when needed
         self._name = _name
 
     def evaluate(self, options: Options) -> Callable[[A], B]:
@@ -79,7 +83,8 @@ class PipelineStep(Evaluatable[Callable[[A], B]], Transformation[A, B]):
         return self(options)(value)
 
     def __repr__(self) -> str:
-        return f"<PipelineStep {self._name or repr(self.step)}>"
+        name = self._name() if callable(self._name) else self._name
+        return f"<PipelineStep {name or repr(self.step)}>"
 
     def __add__(self, other: MaybeEvaluatable[Callable[[B], C]]) -> "Pipeline[A, C]":
         base: Pipeline[A, B] = Pipeline(self)
@@ -154,7 +159,11 @@ class Pipeline(
     def evaluate(self, options: Options) -> Callable[[A], B]:
         """Evaluate the pipeline, returning a function that applies all transformations."""
         tail = self.tail.evaluate(options)
-        rest = self.rest.evaluate(options) if self.rest else lambda x: x
+        if self.rest is None:
+            # A single step needs no composing wrapper around it
+            return tail
+
+        rest = self.rest.evaluate(options)
         return lambda x: tail(rest(x))
 
     def validate(self, options: Options) -> None:
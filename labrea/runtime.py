@@ -169,16 +169,17 @@ class Runtime:
 
         return handler(request)
 
+    # Entering and exiting only touch the current thread's own entry in
+    # _RUNTIMES, so neither needs the module lock.
     def __enter__(self):
-        with lock:
-            self.previous = _RUNTIMES.get(threading.current_thread())
-            _RUNTIMES[threading.current_thread()] = self
-            return self
+        thread = threading.current_thread()
+        self.previous = _RUNTIMES.get(thread)
+        _RUNTIMES[thread] = self
+        return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        with lock:
-            _RUNTIMES[threading.current_thread()] = self.previous
-            self.previous = None
+        _RUNTIMES[threading.current_thread()] = self.previous
+        self.previous = None
 
 
 _RUNTIMES: Dict[threading.Thread, Runtime] = {}
@@ -186,8 +187,13 @@ _RUNTIMES: Dict[threading.Thread, Runtime] = {}
 
 def current_runtime() -> Runtime:
     """Returns the current runtime for the current thread."""
-    with lock:
-        return _RUNTIMES.setdefault(threading.current_thread(), Runtime())
+    thread = threading.current_thread()
+    # Only the current thread sets its own entry, so reads don't need the lock
+    runtime = _RUNTIMES.get(thread)
+    if runtime is None:
+        with lock:
+            runtime = _RUNTIMES[thread] = Runtime()
+    return runtime
 
 
 def handle(
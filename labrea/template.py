@@ -1,6 +1,7 @@
+import functools
 import re
 import warnings
-from typing import Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
 
 from confectioner import mix
 from confectioner.templating import find_template_keys, resolve
@@ -8,6 +9,9 @@ from confectioner.templating import find_template_keys, resolve
 from .exceptions import KeyNotFoundError
 from .types import Evaluatable, Options, Value
 
+if TYPE_CHECKING:
+    from .option import Option
+
 TEMPLATE_PARAM = re.compile(r"^:[a-zA-Z_][a-zA-Z0-9_]*:$")
 
 
@@ -50,6 +54,7 @@ class Template(Evaluatable[str]):
 
     template: str
     params: Dict[str, Evaluatable[Any]]
+    _option_keys: Tuple[str, ...]
 
     def __init__(self, template: str, **kwargs):
         self.template = template
@@ -58,11 +63,14 @@ class Template(Evaluatable[str]):
             for key, value in kwargs.items()
         }
 
-        required_params = {
-            key[1:-1]
-            for key in find_template_keys(template)
-            if TEMPLATE_PARAM.match(key)
-        }
+        required_params = set()
+        option_keys = []
+        for key in find_template_keys(template):
+            if TEMPLATE_PARAM.match(key):
+                required_params.add(key[1:-1])
+            else:
+                option_keys.append(key)
+        self._option_keys = tuple(option_keys)
 
         missing_params = required_params - self.params.keys()
         if missing_params:
@@ -87,31 +95,30 @@ class Template(Evaluatable[str]):
         except KeyError as e:
             raise KeyNotFoundError((*e.args, "UNKNOWN")[0], self) from e
 
-    def validate(self, options: Options) -> None:
-        """Validates that the template can be evaluated using the options."""
+    @functools.cached_property
+    def _options(self) -> Tuple["Option", ...]:
+        """The Options for the non-parameter keys in the template."""
         from .option import Option
 
+        return tuple(Option(key) for key in self._option_keys)
+
+    def validate(self, options: Options) -> None:
+        """Validates that the template can be evaluated using the options."""
         for val in self.params.values():
             val.validate(options)
 
-        for key in find_template_keys(self.template):
-            if TEMPLATE_PARAM.match(key):
-                continue
+        for option in self._options:
             try:
-                Option(key).validate(options)
+                option.validate(options)
             except KeyNotFoundError as e:
                 raise KeyNotFoundError(e.key, self) from e
 
     def keys(self, options: Options) -> Set[str]:
         """Returns the keys that this object depends on."""
-        from .option import Option
-
         keys = set().union(*(value.keys(options) for value in self.params.values()))
-        for key in find_template_keys(self.template):
-            if TEMPLATE_PARAM.match(key):
-                continue
+        for option in self._options:
             try:
-                keys.update(Option(key).keys(options))
+                keys.update(option.keys(options))
             except KeyNotFoundError as e:
                 raise KeyNotFoundError(e.key, self) from e
 
@@ -119,15 +126,10 @@ class Template(Evaluatable[str]):
 
     def explain(self, options: Optional[Options] = None) -> Set[str]:
         """Returns the keys that this object depends on."""
-        from .option import Option
-
         options = options or {}
         keys = set().union(*(value.explain(options) for value in self.params.values()))
-        for key in find_template_keys(self.template):
-            if TEMPLATE_PARAM.match(key):
-                continue
-
-            keys.update(Option(key).explain(options))
+        for option in self._options:
+            keys.update(option.explain(options))
 
         return keys
 
@@ -1,15 +1,21 @@
+import functools
 import hashlib
 import json
+import types
 from abc import ABC, abstractmethod
 from copy import deepcopy
+from enum import Enum
 from typing import (
+    Any,
     Callable,
+    Dict,
     Generic,
     List,
     Mapping,
     Optional,
     Protocol,
     Set,
+    Tuple,
     TypeVar,
     Union,
     overload,
@@ -30,6 +36,38 @@ R = TypeVar("R", covariant=True)
 T = TypeVar("T", contravariant=True)
 X = TypeVar("X")
 
+# Functions and classes are included as deepcopy returns them unchanged anyway
+_IMMUTABLE_TYPES = frozenset(
+    {
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        bool,
+        type(None),
+        range,
+        type(Ellipsis),
+        types.FunctionType,
+        types.BuiltinFunctionType,
+    }
+)
+
+
+def _is_immutable(value: Any) -> bool:
+    """Check whether a value can be shared safely instead of deep-copied."""
+    if (
+        type(value) in _IMMUTABLE_TYPES
+        or isinstance(value, type)
+        or isinstance(value, Enum)
+    ):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(item) for item in value)
+    if type(value) is functools.partial:
+        return _is_immutable((value.func, value.args, *value.keywords.values()))
+    return False
+
 
 class Transformation(Protocol[T, R]):
     """A protocol for objects that can transform values using an options dictionary."""
@@ -41,6 +79,8 @@ class Transformation(Protocol[T, R]):
 class Validatable(ABC):
     """Abstract base class for objects that can be validated against an options dictionary."""
 
+    __slots__ = ()
+
     @abstractmethod
     def validate(self, options: Options) -> None:
         """Validate the object.
@@ -66,6 +106,8 @@ class Validatable(ABC):
 class Cacheable(ABC):
     """Abstract base class for objects that can be cached."""
 
+    __slots__ = ()
+
     @abstractmethod
     def keys(self, options: Options) -> Set[str]:
         """
@@ -112,6 +154,8 @@ class Cacheable(ABC):
 class Explainable(ABC):
     """Abstract base class for objects that can explain themselves."""
 
+    __slots__ = ()
+
     @abstractmethod
     def explain(self, options: Optional[Options] = None) -> Set[str]:
         """Return all keys that this object depends on.
@@ -152,6 +196,8 @@ class Evaluatable(Generic[A], Cacheable, Explainable, Validatable, ABC):
     extensions to be created that can be used within the labrea framework.
     """
 
+    __slots__ = ()
+
     def __call__(self, options: Optional[Options] = None) -> A:
         """Evaluate the object.
 
@@ -229,7 +275,7 @@ class Evaluatable(Generic[A], Cacheable, Explainable, Validatable, ABC):
         Value[A]
             The wrapped value.
         """
-        return Value(value)
+        return _shared_value(value)
 
     @overload
     @staticmethod
@@ -261,7 +307,7 @@ class Evaluatable(Generic[A], Cacheable, Explainable, Validatable, ABC):
         """
         if isinstance(value, Evaluatable):
             return value
-        return Value(value)
+        return _shared_value(value)
 
     def apply(self, func: "MaybeEvaluatable[Callable[[A], B]]") -> "Evaluatable[B]":
         """Lazy application of a function to the result of evaluating the object.
@@ -362,12 +408,23 @@ class Value(Evaluatable[A]):
     """
 
     value: A
+    _immutable: bool
+
+    __slots__ = ("value", "_immutable")
 
     def __init__(self, value: A) -> None:
         self.value = value
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "value":
+            super().__setattr__("_immutable", _is_immutable(value))
+
     def evaluate(self, options: Options) -> A:
         """Return the wrapped value."""
+        # Immutable values cannot be modified by the caller, so skip the copy
+        if self._immutable:
+            return self.value
         try:
             return deepcopy(self.value)
         except Exception:  # noqa: E722
@@ -392,6 +449,38 @@ class Value(Evaluatable[A]):
         return isinstance(other, Value) and self.value == other.value
 
 
+class _SharedValue(Value[A]):
+    """A Value shared by every caller, so its value cannot be reassigned."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if hasattr(self, "value"):
+            raise AttributeError(f"Cannot reassign shared {self!r}")
+        super().__setattr__(name, value)
+
+    def __reduce__(self):
+        return _shared_value, (self.value,)
+
+
+# Shared wrappers for the most common constants, keyed by type so that
+# True/1 and False/0 stay distinct
+_SHARED_VALUES: Dict[Tuple[type, Any], Value] = {
+    (type(value), value): _SharedValue(value)
+    for value in (None, True, False, *range(-5, 257))
+}
+_SHARED_TYPES = (int, bool, type(None))
+
+
+def _shared_value(value: X) -> Value[X]:
+    """Wrap a value, reusing the shared wrapper for common constants."""
+    if type(value) in _SHARED_TYPES:
+        shared = _SHARED_VALUES.get((type(value), value))
+        if shared is not None:
+            return shared
+    return Value(value)
+
+
 class Apply(Generic[A, B], Evaluatable[B]):
     """A class representing the application of a function to the result of evaluating an object.
 
@@ -403,6 +492,8 @@ class Apply(Generic[A, B], Evaluatable[B]):
     evaluatable: Evaluatable[A]
     func: Evaluatable[Callable[[A], B]]
 
+    __slots__ = ("evaluatable", "func")
+
     def __init__(
         self, evaluatable: Evaluatable[A], func: Evaluatable[Callable[[A], B]]
     ) -> None:
@@ -411,20 +502,28 @@ class Apply(Generic[A, B], Evaluatable[B]):
 
     def evaluate(self, options: Options) -> B:
         """Apply the function to the result of evaluating the object."""
-        value = self.evaluatable(options)
-        return self.func(options)(value)
+        value = self.evaluatable.evaluate(options)
+        return self.func.evaluate(options)(value)
 
     def validate(self, options: Options) -> None:
         """Validate the source object and the function to apply to it."""
-        self.evaluatable.validate(options)
-        self.func.validate(options)
+        # Value.validate is a no-op, and functions passed to apply are almost
+        # always plain callables wrapped in a Value, so the walk can skip them
+        if type(self.evaluatable) is not Value:
+            self.evaluatable.validate(options)
+        if type(self.func) is not Value:
+            self.func.validate(options)
 
     def keys(self, options: Options) -> Set[str]:
         """Return the keys the source object and the function depend on."""
+        if type(self.func) is Value:
+            return self.evaluatable.keys(options)
         return self.evaluatable.keys(options) | self.func.keys(options)
 
     def explain(self, options: Optional[Options] = None) -> Set[str]:
         """Return the keys the source object and the function depend on."""
+        if type(self.func) is Value:
+            return self.evaluatable.explain(options)
         return self.evaluatable.explain(options) | self.func.explain(options)
 
     def __repr__(self) -> str:
@@ -442,6 +541,8 @@ class Bind(Generic[A, B], Evaluatable[B]):
     evaluatable: Evaluatable[A]
     func: Callable[[A], Evaluatable[B]]
 
+    __slots__ = ("evaluatable", "func")
+
     def __init__(
         self, evaluatable: Evaluatable[A], func: Callable[[A], Evaluatable[B]]
     ) -> None:
@@ -450,12 +551,16 @@ class Bind(Generic[A, B], Evaluatable[B]):
 
     def evaluate(self, options: Options) -> B:
         """Bind the function to the result of evaluating the object."""
-        return self.func(self.evaluatable(options)).evaluate(options)
+        return self.func(self.evaluatable.evaluate(options)).evaluate(options)
 
     def validate(self, options: Options) -> None:
         """Validate the source object and the function"""
-        self.evaluatable.validate(options)
-        self.func(self.evaluatable(options)).validate(options)
+        # Value.validate is a no-op, so constant inputs and results are skipped
+        if type(self.evaluatable) is not Value:
+            self.evaluatable.validate(options)
+        bound = self.func(self.evaluatable.evaluate(options))
+        if type(bound) is not Value:
+            bound.validate(options)
 
     def keys(self, options: Options) -> Set[str]:
         """Return the keys the source object, function, and result depend on.
@@ -465,7 +570,7 @@ class Bind(Generic[A, B], Evaluatable[B]):
         result depends on.
         """
         return self.evaluatable.keys(options) | self.func(
-            self.evaluatable(options)
+            self.evaluatable.evaluate(options)
         ).keys(options)
 
     def explain(self, options: Optional[Options] = None) -> Set[str]:
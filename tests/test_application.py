@@ -43,6 +43,9 @@ def test_lift():
     with pytest.raises(TypeError):
         FunctionApplication.lift(bad)
 
+    with pytest.raises(TypeError):
+        FunctionApplication.lift(len)
+
     assert FunctionApplication.lift(bad, a=Option('A'), b=Option('B')).evaluate({'A': 1, 'B': 2}) == 3
 
     @FunctionApplication.lift
@@ -92,6 +95,11 @@ def test_lift_partial():
 
     assert PartialApplication.lift(good).evaluate({'B': 2})(1) == 3
 
+    def unary(a: float) -> float:
+        return -a
+
+    assert PartialApplication.lift(unary).evaluate({}) is unary
+
     with pytest.raises(TypeError):
         PartialApplication.lift(bad)
 
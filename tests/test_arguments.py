@@ -31,6 +31,9 @@ def test_evaluatable_args():
 
     assert repr(args) == "EvaluatableArgs(Option('A'), Option('B'), Option('C'))"
 
+    assert EvaluatableArgs().evaluate({}) == ()
+    assert EvaluatableArgs(Option('A')).evaluate({'A': 1}) == (1,)
+
 
 def test_evaluatable_kwargs():
     kwargs = EvaluatableKwargs(a=Option('A'), b=Option('B'), c=Option('C'))
@@ -46,6 +49,8 @@ def test_evaluatable_kwargs():
 
     assert repr(kwargs) == "EvaluatableKwargs(a=Option('A'), b=Option('B'), c=Option('C'))"
 
+    assert EvaluatableKwargs().evaluate({}) == {}
+
 
 def test_evaluatable_arguments():
     args = arguments(Option('A'), b=Option('B'))
@@ -1,4 +1,5 @@
 from typing import List
+import threading
 import uuid
 
 import pytest
@@ -6,9 +7,18 @@ import pytest
 from confectioner.templating import set_dotted_key
 
 from labrea.application import FunctionApplication
-from labrea.cache import cached, NoCache
+from labrea.cache import (
+    Cache,
+    CacheExistsRequest,
+    CacheGetFailure,
+    CacheSetRequest,
+    cached,
+    NoCache,
+)
 from labrea.option import Option
+from labrea.types import Evaluatable
 import labrea.cache
+import labrea.runtime
 
 
 def test_cached():
@@ -27,6 +37,101 @@ def test_nocache():
     assert cached_uuid4() != cached_uuid4()
 
 
+def test_cached_single_flight():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(x: int = Option('X')) -> uuid.UUID:
+        calls.append(x)
+        started.set()
+        release.wait(5)
+        return uuid.uuid4()
+
+    cached_slow = cached(FunctionApplication.lift(slow))
+    results = []
+
+    def worker():
+        results.append(cached_slow({'X': 1}))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert len(set(results)) == 1
+
+
+def test_cached_single_flight_timeout(monkeypatch):
+    monkeypatch.setattr(labrea.cache, '_IN_FLIGHT_TIMEOUT', 0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(x: int = Option('X')) -> uuid.UUID:
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+        return uuid.uuid4()
+
+    cached_slow = cached(FunctionApplication.lift(slow))
+    owner = threading.Thread(target=cached_slow, args=({'X': 1},))
+    owner.start()
+    started.wait(5)
+
+    assert isinstance(cached_slow({'X': 1}), uuid.UUID)
+    assert owner.is_alive()
+    release.set()
+    owner.join()
+
+
+def test_cached_single_flight_disabled():
+    calls = []
+    barrier = threading.Barrier(4)
+
+    def slow(x: int = Option('X')) -> uuid.UUID:
+        calls.append(x)
+        barrier.wait(5)
+        return uuid.uuid4()
+
+    cached_slow = cached(FunctionApplication.lift(slow))
+    results = []
+
+    def worker():
+        with labrea.cache.disabled():
+            results.append(cached_slow({'X': 1}))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1, 1, 1, 1]
+    assert len(set(results)) == 4
+
+
+def test_cached_fingerprint_once(monkeypatch):
+    calls = []
+    fingerprint = Evaluatable.fingerprint
+
+    def counting_fingerprint(self, options):
+        calls.append(self)
+        return fingerprint(self, options)
+
+    monkeypatch.setattr(Evaluatable, 'fingerprint', counting_fingerprint)
+
+    x = cached(Option('X'))
+    assert x({'X': 1}) == 1
+    assert len(calls) == 1
+    assert x({'X': 1}) == 1
+    assert len(calls) == 2
+
+
 def test_cached_decorator():
     @cached
     @FunctionApplication.lift
@@ -63,3 +168,51 @@ def test_disable_cache(method):
 
     assert a == b == e
     assert a != c and c != d
+
+
+@pytest.mark.parametrize('method', ['ctx', 'LABREA.CACHE.DISABLED'])
+def test_disable_cache_unserializable(method):
+    value = object()
+    x = cached(Option('X'))
+
+    if method == 'ctx':
+        with labrea.cache.disabled():
+            assert x({'X': value}) is value
+    else:
+        options = {'X': value}
+        set_dotted_key(method, True, options)
+        assert x(options) is value
+
+
+class _LastValueCache(Cache):
+    def __init__(self):
+        self.values = {}
+
+    def get(self, evaluatable, options):
+        try:
+            return self.values[id(evaluatable)]
+        except KeyError as e:
+            raise CacheGetFailure(evaluatable, options, self) from e
+
+    def set(self, evaluatable, options, value):
+        self.values[id(evaluatable)] = value
+
+
+def test_unserializable_custom_cache():
+    value = object()
+    x = cached(Option('X'), _LastValueCache())
+
+    assert x({'X': value}) is value
+    assert x({'X': value}) is value
+
+
+def test_unserializable_custom_handler():
+    value = object()
+    x = cached(Option('X'))
+
+    handlers = {
+        CacheExistsRequest: lambda request: False,
+        CacheSetRequest: lambda request: request.value,
+    }
+    with labrea.runtime.handle(handlers):
+        assert x({'X': value}) is value
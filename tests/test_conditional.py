@@ -1,6 +1,7 @@
 from labrea.conditional import switch, SwitchError, case, CaseWhenError
 from labrea.exceptions import KeyNotFoundError, InsufficientInformationError
 from labrea.option import Option
+from labrea.types import Value
 import pytest
 
 
@@ -51,6 +52,29 @@ def test_switch():
     assert switch('A', {'X': 1})({'A': 'X'}) == 1
 
 
+def test_switch_constant_dispatch():
+    s = switch(Value('Y'), {'X': 42, 'Y': Option('Z')})
+
+    assert s({'Z': 43}) == 43
+    assert s.keys({'Z': 43}) == {'Z'}
+    with pytest.raises(KeyNotFoundError):
+        s.evaluate({})
+
+    with pytest.raises(SwitchError):
+        switch(Value('W'), {'X': 42}).evaluate({})
+
+    assert switch(Value('W'), {'X': 42}, 43).evaluate({}) == 43
+
+    s.dispatch = Value('X')
+    assert s.evaluate({}) == 42
+    s.lookup = {'X': Value(44)}
+    assert s.evaluate({}) == 44
+
+    unhashable = switch(Value(['X']), {'X': 42})
+    with pytest.raises(TypeError):
+        unhashable.evaluate({})
+
+
 def test_case_when():
     c = case(Option('A')).when(
         lambda x: x == 'X',
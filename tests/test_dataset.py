@@ -3,6 +3,7 @@ import pytest
 import uuid
 import pickle
 
+from labrea.cache import MemoryCache
 from labrea.computation import CallbackEffect
 from labrea.dataset import Dataset, dataset, abstractdataset
 from labrea.exceptions import EvaluationError
@@ -107,6 +108,9 @@ def test_nocache():
 
     assert uuid4() != uuid4()
 
+    uuid4.set_cache(MemoryCache())
+    assert uuid4() == uuid4()
+
 
 def test_effect():
     store = None
@@ -141,6 +145,17 @@ def test_effect():
     result = uuid4()
     assert store == result
 
+    @dataset.nocache
+    def uuid4() -> uuid.UUID:
+        return uuid.uuid4()
+
+    result = uuid4()
+    assert store != result
+
+    uuid4.add_effect(set_store)
+    result = uuid4()
+    assert store == result
+
     @dataset.nocache(effects=[set_store])
     def uuid4() -> uuid.UUID:
         return uuid.uuid4()
@@ -187,6 +202,18 @@ def test_where():
     assert add.explain() == {'X', 'Y'}
 
 
+def test_factory_update():
+    base = dataset.where(x=1)
+    factory = base.where(y=Option('Y'))(dispatch='D')
+
+    assert list(base.defaults) == ['x']
+    assert factory.defaults['x'] is base.defaults['x']
+    assert repr(factory.defaults['y']) == "Option('Y')"
+    assert repr(factory.dispatch) == "Option('D')"
+    assert factory.cache is base.cache
+    assert factory.nocache.cache is not None and base.cache is None
+
+
 def test_force_options():
     @dataset(options={'A': 1})
     def x(a: int = Option('A'), b: int = Option('B')) -> int:
@@ -1,4 +1,7 @@
+import copy
+
 import pytest
+from confectioner.templating import set_dotted_key
 
 from labrea import datasetclass, Option
 from labrea.exceptions import KeyNotFoundError
@@ -56,6 +59,47 @@ def test_repr():
     assert repr(X(opts)) == f'X({opts!r})'
 
 
+def _baseline_repr(cls, options):
+    options = copy.deepcopy(options)
+    repr_options = {}
+    for key in sorted(cls.keys(options)):
+        set_dotted_key(key, options.get(key), repr_options)
+    return f'{cls.__name__}({repr_options!r})'
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        {},
+        {'A': {'X': 1, 'Z': 2}, 'B': [3]},
+        {'A': {'Z': 2}},
+        {'A': {'X': 1}, 'A.X': 4, 'B': [3, 4]},
+    ],
+)
+def test_repr_nested(options):
+    @datasetclass
+    class Y:
+        a: dict = Option('A', default={})
+        x: int = Option('A.X', default=0)
+        b: int = Option('B.0', default=0)
+
+    original = copy.deepcopy(options)
+    assert repr(Y(options)) == _baseline_repr(Y, options)
+    assert options == original
+
+
+def test_options_mutated_after_init():
+    opts = {'A': 1, 'C': 3}
+    x = X(opts)
+    opts['A'] = 2
+    assert '_repr_options' not in vars(x)
+    assert repr(x) == "X({'A': 1, 'C': 3})"
+    assert x == X({'A': 1, 'C': 3})
+
+    opts.clear()
+    assert repr(x) == "X({'A': 1, 'C': 3})"
+
+
 def test_missing_default():
     with pytest.raises(ValueError):
         @datasetclass
@@ -1,3 +1,6 @@
+import copy
+import functools
+import pickle
 import pytest
 
 from labrea.types import Evaluatable, Value
@@ -24,10 +27,41 @@ def test_value():
     assert Value(uncopyable).evaluate({}) is uncopyable
 
 
+def test_value_copies_mutable():
+    shared = (1, "a", frozenset({None}))
+    assert Value(shared).evaluate({}) is shared
+
+    nested = (1, [2])
+    assert Value(nested).evaluate({}) is not nested
+
+    value = Value([1, 2])
+    result = value.evaluate({})
+    result.append(3)
+    assert value.evaluate({}) == [1, 2]
+
+    value.value = (1, 2)
+    assert value.evaluate({}) is value.value
+
+
 def test_unit():
     assert Evaluatable.unit(1)() == 1
 
 
+def test_shared_values():
+    assert Evaluatable.unit(None) is Evaluatable.ensure(None)
+    assert Evaluatable.ensure(1) is Evaluatable.unit(1)
+    assert Evaluatable.ensure(True) is not Evaluatable.ensure(1)
+    assert Evaluatable.ensure(True)() is True
+    assert Evaluatable.ensure(1000) is not Evaluatable.ensure(1000)
+
+    shared = Evaluatable.ensure(1)
+    with pytest.raises(AttributeError):
+        shared.value = 99
+    assert Evaluatable.ensure(1)() == 1
+    assert pickle.loads(pickle.dumps(shared)) is shared
+    assert copy.deepcopy(shared) is shared
+
+
 @pytest.mark.parametrize(
     'wrapper,method',
     [
@@ -54,6 +88,17 @@ def test_apply(wrapper, method):
     assert repr(apply) == f"Value(42).apply(Value({repr(incr)}))"
 
 
+def test_apply_keys():
+    def incr(x):
+        return x + 1
+
+    options = {'A': 1, 'F': incr}
+    assert Option('A').apply(incr).keys(options) == {'A'}
+    assert Option('A').apply(Option('F')).keys(options) == {'A', 'F'}
+    assert Option('A').apply(Option('F')).explain() == {'A', 'F'}
+    assert Option('A').apply(Option('F'))(options) == 2
+
+
 def test_bind():
     value = Value(42)
 
@@ -68,6 +113,20 @@ def test_bind():
     assert repr(bind) == f"Value(42).bind({repr(incr)})"
 
 
+def test_validate_non_values():
+    bind = Value('B').bind(Option)
+    apply = Value(42).apply(Option('F'))
+
+    bind.validate({'B': 1})
+    apply.validate({'F': str})
+    with pytest.raises(KeyNotFoundError):
+        bind.validate({})
+    with pytest.raises(KeyNotFoundError):
+        apply.validate({})
+    with pytest.raises(KeyNotFoundError):
+        Option('A').bind(Value).validate({})
+
+
 def test_type_error():
     with pytest.raises(TypeError):
         Value(42).bind(42)
@@ -81,6 +140,13 @@ def test_error_str():
     assert str(KeyNotFoundError('key', Value(1))) == "Originating in Value(1) | Key 'key' not found"
 
 
+def test_key_not_found_pickle():
+    error = pickle.loads(pickle.dumps(KeyNotFoundError('key', Value(1))))
+    assert error.key == 'key'
+    assert error.msg == "Key 'key' not found"
+    assert error.args == ("Key 'key' not found", Value(1))
+
+
 def test_fingerprint():
     value = Value(42)
     option = Option('A')
@@ -95,3 +161,23 @@ def test_fingerprint():
 def test_result():
     option = Option('A')
     assert option.result is option
+
+
+def test_value_shares_functions():
+    partial = functools.partial(max, 0)
+    assert Value(partial).evaluate({}) is partial
+    assert Value(max).evaluate({}) is max
+    assert Value(str).evaluate({}) is str
+
+    mutable = functools.partial(max, [0])
+    assert Value(mutable).evaluate({}) is not mutable
+
+
+def test_slots():
+    apply = Option('A').apply(str)
+    value = pickle.loads(pickle.dumps(Value([1])))
+
+    assert not hasattr(Value(1), '__dict__')
+    assert not hasattr(apply, '__dict__')
+    assert pickle.loads(pickle.dumps(apply))({'A': 1}) == '1'
+    assert value.evaluate({}) == [1] and value.evaluate({}) is not value.value
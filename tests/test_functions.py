@@ -1,3 +1,6 @@
+import pickle
+import pytest
+
 from labrea.option import Option
 import labrea.functions as lf
 
@@ -20,3 +23,28 @@ def test_reduce():
 
     assert r1({'A': [1, 2, 3, 4]}) == 10
     assert r2({'A': [1, 2, 3, 4]}) == 20
+    assert r2({'A': []}) == 10
+    with pytest.raises(TypeError):
+        r1({'A': []})
+    with pytest.raises(TypeError):
+        (Option('A') >> lf.reduce(max))({'A': []})
+    assert repr(lf.reduce(max)) == f"<PipelineStep reduce({max!r})>"
+
+
+def test_evaluatable_func():
+    m = Option('A') >> lf.map(Option('F')) >> list
+    r = Option('A') >> lf.reduce(Option('F'), Option('I'))
+
+    assert m({'A': [1, 2], 'F': str}) == ['1', '2']
+    assert m.keys({'A': [1, 2], 'F': str}) == {'A', 'F'}
+    assert r({'A': [1, 2], 'F': max, 'I': 10}) == 10
+    assert r.explain() == {'A', 'F', 'I'}
+
+
+def test_repr_and_pickle():
+    step = lf.reduce(max, initial=Option('I'))
+
+    assert repr(lf.map(str)) == f"<PipelineStep map({str!r})>"
+    assert repr(step) == f"<PipelineStep reduce({max!r}, initial=Option('I'))>"
+    assert repr(pickle.loads(pickle.dumps(step))) == repr(step)
+    assert pickle.loads(pickle.dumps(lf.filter(bool)))({})([0, 1]).__next__() == 1
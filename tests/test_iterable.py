@@ -24,6 +24,14 @@ def test_iter():
     assert repr(i) == "Iter(Option('A'), Value(2))"
 
 
+def test_iter_is_lazy():
+    result = Iter(2, Option('A')).evaluate({})
+
+    assert next(iter(result)) == 2
+    with pytest.raises(EvaluationError):
+        list(result)
+
+
 def test_iterate():
     i = Map(Option('A'), {'A': Option('B')})
 
@@ -1,5 +1,5 @@
 from labrea.exceptions import KeyNotFoundError
-from labrea.option import AllOptions, Option, WithOptions, WithDefaultOptions
+from labrea.option import AllOptions, Option, WithOptions, WithDefaultOptions, _mix
 from labrea.template import Template
 import pytest
 
@@ -15,6 +15,17 @@ def test_basic():
     assert option.explain() == {'A'}
 
 
+def test_resolved_values():
+    option = Option('A')
+
+    assert option.evaluate({'A': 'plain'}) == 'plain'
+    assert option.evaluate({'A': '{B}', 'B': 1}) == 1
+    assert option.evaluate({'A': ['{B}', 2], 'B': 1}) == [1, 2]
+    assert option.evaluate({'A': {'X': '{B}'}, 'B': 1}) == {'X': 1}
+    assert option.evaluate({'A': '\\{B\\}', 'B': 1}) == '{B}'
+    assert option.evaluate({'A': ('{B}',), 'B': 1}) == ('{B}',)
+
+
 def test_multiple_provided():
     option = Option('A')
     options = {'A': 42, 'V': 43}
@@ -154,6 +165,18 @@ def test_repr():
     assert repr(Option('A', doc='Hello, World!')) == "Option('A')"
 
 
+def test_dotted_keys():
+    options = {'A': [{'B': 1}], 'C': {'0': 2}}
+
+    assert Option('A.0.B')(options) == 1
+    assert Option('A.0.B').keys(options) == {'A.0.B'}
+    assert Option('A.1.B', 3)(options) == 3
+    assert Option('C.0', 4)(options) == 4
+    assert Option('A.B').explain(options) == {'A.B'}
+    with pytest.raises(KeyNotFoundError):
+        Option('A.0.C').validate(options)
+
+
 def test_with_options():
     w = WithOptions(Option('A'), {'A': 42})
 
@@ -171,6 +194,23 @@ def test_with_options():
 
     assert repr(w) == "WithOptions(Option('A'), {'A': 42})"
 
+    w = WithOptions(Option('A'), {})
+
+    assert w.evaluate({'A': 43}) == 43
+    assert w.keys({'A': 43}) == {'A'}
+    assert w.explain() == {'A'}
+
+
+def test_with_nested_options():
+    w = WithOptions(AllOptions, {'A': {'X': 1}})
+
+    assert w.evaluate({'B': 2}) == {'A': {'X': 1}, 'B': 2}
+    assert w.evaluate({'A': {'X': 2, 'Y': 3}}) == {'A': {'X': 1, 'Y': 3}}
+
+    w = WithDefaultOptions(AllOptions, {'A': {'X': 1}})
+
+    assert w.evaluate({'A': {'Y': 3}}) == {'A': {'X': 1, 'Y': 3}}
+
 
 def test_with_default_options():
     w = WithDefaultOptions(Option('A'), {'A': 42})
@@ -200,3 +240,13 @@ def test_all_options():
     assert AllOptions.explain(options) == {'A', 'B', 'C'}
 
     assert AllOptions.explain() == set()
+
+
+def test_mix_copies_nested():
+    nested = {'X': [1]}
+    mixed = _mix({'A': 1}, {'B': nested})
+    mixed['B']['X'].append(2)
+    mixed['B']['Y'] = 3
+
+    assert nested == {'X': [1]}
+    assert _mix({'A': 1}, {'B': 2}) == {'A': 1, 'B': 2}
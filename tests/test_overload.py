@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from labrea.application import FunctionApplication
@@ -5,6 +7,7 @@ from labrea import Value
 from labrea.exceptions import KeyNotFoundError
 from labrea.option import Option
 from labrea.overload import Overloaded
+import labrea.overload
 
 
 def test_overloaded():
@@ -37,7 +40,30 @@ def test_overloaded():
     assert overloads.explain({'A': 'dummy'}) == {'A'}
     assert overloads.explain() == {'X', 'Y'}
 
+    overloads.register('dummy', Value(-1))
+    assert overloads.evaluate({'A': 'dummy'}) == -1
+
+
+def test_register_during_switch_build(monkeypatch):
+    overloads = Overloaded(Option('A'), {'X': Value(1)})
+    build = labrea.overload.switch
+    registering = []
+
+    def slow_switch(*args, **kwargs):
+        if not registering:
+            thread = threading.Thread(target=overloads.register, args=('Y', Value(2)))
+            registering.append(thread)
+            thread.start()
+            thread.join(0.1)
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(labrea.overload, 'switch', slow_switch)
+    assert overloads.evaluate({'A': 'X'}) == 1
+    registering[0].join()
+    assert overloads.evaluate({'A': 'Y'}) == 2
 
+    overloads.default = Value(3)
+    assert overloads.evaluate({'A': 'Z'}) == 3
 def test_repr():
     assert repr(Overloaded(Option('A'), {'X': Value(42)})) == "Overloaded(Option('A'), {'X': Value(42)})"
     assert repr(Overloaded(Option('A'), {'X': Value(42)}, default=43)) == "Overloaded(Option('A'), {'X': Value(42)}, Value(43))"
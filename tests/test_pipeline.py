@@ -62,6 +62,15 @@ def test_add():
     assert list(Pipeline() + incr) == list(incr + Pipeline()) == [incr]
 
 
+def test_single_step():
+    def decr(x: float) -> float:
+        return x - 1
+
+    assert Pipeline(PipelineStep(Value(decr))).evaluate({}) is decr
+    assert Pipeline().transform(1) == 1
+    assert (Pipeline() + incr).transform(1) == 2
+
+
 def test_transformation():
     assert incr.transform(1) == 2
     assert list(repeat.transform(1, {'N': 3})) == [1, 1, 1]